@@ -28,11 +28,8 @@ def calculate_undeclared(
     'resolved_deps' (representing declared dependencies).
     """
     declared_names = {name for p in resolved_deps.values() for name in p.import_names}
-    undeclared = [
-        i
-        for i in imports
-        if i.name not in declared_names.union(settings.ignore_undeclared)
-    ]
+    declared_names.update(settings.ignore_undeclared)
+    undeclared = [i for i in imports if i.name not in declared_names]
     undeclared.sort(key=lambda i: i.name)  # groupby requires pre-sorting
     return [
         UndeclaredDependency(name, [i.source for i in imports])
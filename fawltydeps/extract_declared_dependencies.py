@@ -4,6 +4,7 @@ import ast
 import configparser
 import logging
 import re
+import stat
 import sys
 from functools import partial
 from itertools import takewhile
@@ -22,21 +23,17 @@ from fawltydeps.types import (
 )
 from fawltydeps.utils import walk_dir
 
-if sys.version_info >= (3, 11):
-    import tomllib  # pylint: disable=E1101
-else:
-    import tomli as tomllib
-
 logger = logging.getLogger(__name__)
 
 ERROR_MESSAGE_TEMPLATE = "Failed to %s %s %s dependencies in %s: %s"
 # https://pip.pypa.io/en/stable/reference/requirements-file-format/#per-requirement-options
-PER_REQUIREMENT_OPTIONS = [
+# A tuple, so that it can be passed directly to str.startswith()
+PER_REQUIREMENT_OPTIONS = (
     "--install-option",
     "--global-option",
     "--config-setting",
     "--hash",
-]
+)
 
 NamedLocations = Iterator[Tuple[str, Location]]
 
@@ -80,9 +77,7 @@ def parse_requirements_contents(
             # Try again with the initial part of the line preceding any of the
             # PER_REQUIREMENT_OPTIONS
             pre_opt_words = takewhile(
-                lambda word: not any(
-                    word.startswith(opt) for opt in PER_REQUIREMENT_OPTIONS
-                ),
+                lambda word: not word.startswith(PER_REQUIREMENT_OPTIONS),
                 cleaned.split(),
             )
             try:
@@ -298,6 +293,13 @@ def parse_pyproject_contents(
     - PEP 621 core metadata fields
     - Poetry-specific metadata in `tool.poetry` sections.
     """
+    # Deferred import: this is the only place in this module that needs a
+    # TOML parser, so don't make projects without a pyproject.toml pay for it.
+    if sys.version_info >= (3, 11):
+        import tomllib  # pylint: disable=E1101,import-outside-toplevel
+    else:
+        import tomli as tomllib  # pylint: disable=import-outside-toplevel
+
     parsed_contents = tomllib.loads(text)
 
     yield from parse_pep621_pyproject_contents(parsed_contents, source)
@@ -320,24 +322,28 @@ class ParsingStrategy(NamedTuple):
 def first_applicable_parser(
     path: Path,
 ) -> Optional[Tuple[ParserChoice, ParsingStrategy]]:
-    """Find the first applicable parser choice for given path."""
-    return next(
-        (
-            (choice, parser)
-            for choice, parser in PARSER_CHOICES.items()
-            if parser.applies_to_path(path)
-        ),
-        None,
-    )
+    """Find the first applicable parser choice for given path.
+
+    This runs for every file found while traversing a dependency directory,
+    so dispatch on the file name directly (one dict lookup + one regex match)
+    instead of trying each parser's applicability predicate in turn.
+    """
+    choice = EXACT_FILE_NAME_PARSER_CHOICES.get(path.name)
+    if choice is None and REQUIREMENTS_FILE_PATTERN.match(path.name):
+        choice = ParserChoice.REQUIREMENTS_TXT
+    return None if choice is None else (choice, PARSER_CHOICES[choice])
+
 
+# Compiled once: first_applicable_parser() tests this pattern against every
+# file found while traversing a directory tree.
+REQUIREMENTS_FILE_PATTERN = re.compile(r".*\brequirements\b.*\.(txt|in)")
 
 PARSER_CHOICES = {
     ParserChoice.PYPROJECT_TOML: ParsingStrategy(
         lambda path: path.name == "pyproject.toml", parse_pyproject_contents
     ),
     ParserChoice.REQUIREMENTS_TXT: ParsingStrategy(
-        lambda path: re.compile(r".*\brequirements\b.*\.(txt|in)").match(path.name)
-        is not None,
+        lambda path: REQUIREMENTS_FILE_PATTERN.match(path.name) is not None,
         parse_requirements_contents,
     ),
     ParserChoice.SETUP_CFG: ParsingStrategy(
@@ -348,6 +354,14 @@ PARSER_CHOICES = {
     ),
 }
 
+# Fast-path dispatch table for first_applicable_parser(): all parser choices
+# except REQUIREMENTS_TXT apply to exactly one file name.
+EXACT_FILE_NAME_PARSER_CHOICES = {
+    "pyproject.toml": ParserChoice.PYPROJECT_TOML,
+    "setup.cfg": ParserChoice.SETUP_CFG,
+    "setup.py": ParserChoice.SETUP_PY,
+}
+
 
 def extract_declared_dependencies_from_path(
     path: Path, parser_choice: Optional[ParserChoice] = None
@@ -361,7 +375,13 @@ def extract_declared_dependencies_from_path(
     Generate (i.e. yield) a DeclaredDependency object for each dependency found.
     There is no guaranteed ordering on the generated dependencies.
     """
-    if path.is_file():
+    # A single stat() tells us whether this is a file or a dir; calling both
+    # .is_file() and .is_dir() would stat the path twice.
+    try:
+        mode = path.stat().st_mode
+    except OSError:
+        mode = 0
+    if stat.S_ISREG(mode):
         if parser_choice is not None:
             parser = PARSER_CHOICES[parser_choice]
             if not parser.applies_to_path(path):
@@ -376,14 +396,14 @@ def extract_declared_dependencies_from_path(
                 )
             parser = choice_and_parser[1]
         yield from parser.execute(path.read_text(), Location(path))
-    elif path.is_dir():
+    elif stat.S_ISDIR(mode):
         logger.debug("Extracting dependencies from files under %s", path)
         for file in walk_dir(path):
             choice_and_parser = first_applicable_parser(file)
             if choice_and_parser is None:  # nothing found
                 continue
             if parser_choice is None or choice_and_parser[0] == parser_choice:
-                logger.debug(f"Extracting dependencies: {file}")
+                logger.debug("Extracting dependencies: %s", file)
                 yield from choice_and_parser[1].execute(
                     file.read_text(), Location(file)
                 )
@@ -3,7 +3,9 @@
 import ast
 import json
 import logging
+import stat
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Iterator, Optional, Set, Tuple
 
@@ -20,12 +22,17 @@ from fawltydeps.utils import dirs_between, walk_dir
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
 def make_isort_config(path: Path, src_paths: Tuple[Path, ...] = ()) -> isort.Config:
     """Configure isort to correctly classify import statements.
 
     In order for isort to correctly differentiate between first- and third-party
     imports, we need to pass in a configuration object that tells isort where
     to look for first-party imports.
+
+    Building an isort.Config is not cheap, and parse_dir() asks for the same
+    configuration once per file in a directory, so memoize the (immutable)
+    config objects.
     """
     return isort.Config(
         src_paths=(path, *src_paths),  # Resolve first-party imports
@@ -35,6 +42,30 @@ def make_isort_config(path: Path, src_paths: Tuple[Path, ...] = ()) -> isort.Con
 
 ISORT_FALLBACK_CONFIG = make_isort_config(Path("."))
 
+# Module names that can never resolve to a third-party import, no matter the
+# isort configuration. Testing membership here is much cheaper than asking
+# isort, so use this to short-circuit classification of stdlib imports (the
+# common case). Note that isort is configured with py_version="all", hence
+# anything in the current interpreter's stdlib is also in isort's stdlib set.
+if sys.version_info >= (3, 10):
+    STDLIB_MODULES = frozenset(sys.stdlib_module_names) | frozenset(
+        sys.builtin_module_names
+    )
+else:  # sys.stdlib_module_names was introduced in Python v3.10
+    STDLIB_MODULES = frozenset(sys.builtin_module_names)
+
+
+@lru_cache(maxsize=None)
+def place_module(name: str, config: isort.Config) -> str:
+    """Classify the given module name with isort, and cache the result.
+
+    isort.place_module() performs non-trivial work to classify a module name,
+    and the same module names tend to recur many times while parsing a code
+    base. Cache the classification so that each unique (name, config) pair is
+    only passed to isort once.
+    """
+    return isort.place_module(name, config=config)
+
 
 def parse_code(
     code: str, *, source: Location, local_context: isort.Config = ISORT_FALLBACK_CONFIG
@@ -46,16 +77,22 @@ def parse_code(
     """
 
     def is_external_import(name: str) -> bool:
-        return isort.place_module(name, config=local_context) == "THIRDPARTY"
+        if name in STDLIB_MODULES:
+            return False
+        return place_module(name, local_context) == "THIRDPARTY"
 
     try:
         parsed_code = ast.parse(code, filename=str(source.path))
     except SyntaxError as exc:
         logger.error(f"Could not parse code from {source}: {exc}")
         return
+    # ast.dump() is expensive and runs once per import statement; don't even
+    # call it when debug logging is disabled.
+    debug = logger.isEnabledFor(logging.DEBUG)
     for node in ast.walk(parsed_code):
         if isinstance(node, ast.Import):
-            logger.debug(ast.dump(node))
+            if debug:
+                logger.debug(ast.dump(node))
             for alias in node.names:
                 name = alias.name.split(".", 1)[0]
                 if is_external_import(name):
@@ -63,7 +100,8 @@ def parse_code(
                         name=name, source=source.supply(lineno=node.lineno)
                     )
         elif isinstance(node, ast.ImportFrom):
-            logger.debug(ast.dump(node))
+            if debug:
+                logger.debug(ast.dump(node))
             # Relative imports are always relative to the current package, and
             # will therefore not resolve to a third-party package.
             # They are therefore uninteresting to us.
@@ -94,7 +132,7 @@ def parse_notebook_file(
         for lineno, line in enumerate(lines, start=1):
             if line.lstrip().startswith(("!", "%")):
                 logger.info(
-                    f"Found magic command {line!r} at {source.supply(lineno=lineno)}"
+                    "Found magic command %r at %s", line, source.supply(lineno=lineno)
                 )
                 command_continues = line.rstrip("\n").endswith("\\")
                 yield "\n"
@@ -163,12 +201,16 @@ def parse_dir(path: Path) -> Iterator[ParsedImport]:
     across several files) will be yielded multiple times.
     """
     for file in walk_dir(path):
+        # Skip files we won't parse _before_ building their isort config;
+        # most files in a big project are neither .py nor .ipynb.
+        if file.suffix not in (".py", ".ipynb"):
+            continue
         local_context = make_isort_config(
             path=path, src_paths=tuple(dirs_between(path, file.parent))
         )
         if file.suffix == ".py":
             yield from parse_python_file(file, local_context=local_context)
-        elif file.suffix == ".ipynb":
+        else:
             yield from parse_notebook_file(file, local_context=local_context)
 
 
@@ -186,7 +228,13 @@ def parse_any_arg(arg: PathOrSpecial) -> Iterator[ParsedImport]:
         logger.info("Parsing Python code from standard input")
         return parse_code(sys.stdin.read(), source=Location(arg))
     assert isinstance(arg, Path)
-    if arg.is_file():
+    # A single stat() tells us whether this is a file or a dir; calling both
+    # .is_file() and .is_dir() would stat the path twice.
+    try:
+        mode = arg.stat().st_mode
+    except OSError:
+        mode = 0
+    if stat.S_ISREG(mode):
         if arg.suffix == ".py":
             logger.info("Parsing Python file %s", arg)
             return parse_python_file(arg)
@@ -197,7 +245,7 @@ def parse_any_arg(arg: PathOrSpecial) -> Iterator[ParsedImport]:
             ctx="Supported formats are .py and .ipynb; Cannot parse code",
             path=arg,
         )
-    if arg.is_dir():
+    if stat.S_ISDIR(mode):
         logger.info("Parsing Python files under %s", arg)
         return parse_dir(arg)
     raise UnparseablePathException(
@@ -16,15 +16,10 @@ import logging
 import sys
 from dataclasses import dataclass
 from functools import partial
-from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional, TextIO, no_type_check
 
-from pydantic.json import custom_pydantic_encoder  # pylint: disable=no-name-in-module
-
-from fawltydeps import extract_imports
 from fawltydeps.check import calculate_undeclared, calculate_unused
-from fawltydeps.extract_declared_dependencies import extract_declared_dependencies
 from fawltydeps.packages import Package, resolve_dependencies
 from fawltydeps.settings import (
     Action,
@@ -78,7 +73,7 @@ class Analysis:
 
     def is_enabled(self, *args: Action) -> bool:
         """Return True if any of the given actions are in self.settings."""
-        return len(self.settings.actions.intersection(args)) > 0
+        return not self.settings.actions.isdisjoint(args)
 
     @classmethod
     def create(cls, settings: Settings) -> "Analysis":
@@ -96,11 +91,27 @@ class Analysis:
         if ret.is_enabled(
             Action.LIST_IMPORTS, Action.REPORT_UNDECLARED, Action.REPORT_UNUSED
         ):
+            # Import here, instead of at the top of this module, to avoid
+            # paying the (considerable) cost of importing isort & friends for
+            # actions that don't need to parse any code.
+            from fawltydeps import (  # pylint: disable=import-outside-toplevel
+                extract_imports,
+            )
+
+            # The parsed imports must be materialized (not streamed): they are
+            # consumed by both calculate_undeclared() and calculate_unused()
+            # below, and are part of our JSON output regardless of which
+            # actions are enabled. The same goes for declared_deps below.
             ret.imports = list(extract_imports.parse_any_args(settings.code))
 
         if ret.is_enabled(
             Action.LIST_DEPS, Action.REPORT_UNDECLARED, Action.REPORT_UNUSED
         ):
+            # Deferred import, for the same reason as extract_imports above.
+            from fawltydeps.extract_declared_dependencies import (  # pylint: disable=import-outside-toplevel
+                extract_declared_dependencies,
+            )
+
             ret.declared_deps = list(
                 extract_declared_dependencies(
                     settings.deps, settings.deps_parser_choice
@@ -133,6 +144,11 @@ class Analysis:
 
     def print_json(self, out: TextIO) -> None:
         """Print the JSON representation of this analysis to 'out'."""
+        # Deferred import: pydantic's JSON helpers are only needed here.
+        from pydantic.json import (  # pylint: disable=no-name-in-module,import-outside-toplevel
+            custom_pydantic_encoder,
+        )
+
         # The default pydantic_encoder uses list() to serialize set objects.
         # Use sorted() instead, to ensure stable serialization to JSON.
         # This requires that all our sets contain orderable elements!
@@ -144,9 +160,11 @@ class Analysis:
         if self.is_enabled(Action.LIST_IMPORTS):
             assert self.imports is not None  # sanity-check / convince Mypy
             if details:
-                # Sort imports by source, then by name
-                for imp in sorted(self.imports, key=attrgetter("source", "name")):
-                    print(f"{imp.source}: {imp.name}", file=out)
+                # Sort imports by source, then by name. Sorting (source, name)
+                # tuples directly avoids repeated attribute lookups inside the
+                # sort, and the tuples are exactly what we print anyway.
+                for source, name in sorted((i.source, i.name) for i in self.imports):
+                    print(f"{source}: {name}", file=out)
             else:
                 unique_imports = {i.name for i in self.imports}
                 print("\n".join(sorted(unique_imports)), file=out)
@@ -154,15 +172,15 @@ class Analysis:
         if self.is_enabled(Action.LIST_DEPS):
             assert self.declared_deps is not None  # sanity-check / convince Mypy
             if details:
-                # Sort dependencies by location, then by name
-                for dep in sorted(
-                    set(self.declared_deps), key=attrgetter("source", "name")
+                # Sort dependencies by location, then by name (as above, the
+                # set comprehension also deduplicates)
+                for source, name in sorted(
+                    {(d.source, d.name) for d in self.declared_deps}
                 ):
-                    print(f"{dep.source}: {dep.name}", file=out)
+                    print(f"{source}: {name}", file=out)
             else:
-                print(
-                    "\n".join(sorted(set(d.name for d in self.declared_deps))), file=out
-                )
+                unique_deps = {d.name for d in self.declared_deps}
+                print("\n".join(sorted(unique_deps)), file=out)
 
         if self.is_enabled(Action.REPORT_UNDECLARED) and self.undeclared_deps:
             print("\nThese imports appear to be undeclared dependencies:", file=out)
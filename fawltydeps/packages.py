@@ -4,7 +4,8 @@ import logging
 import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Iterable, Optional, Set
+from functools import lru_cache
+from typing import AbstractSet, Dict, Iterable, Optional, Set, Tuple
 
 from fawltydeps.utils import hide_dataclass_fields
 
@@ -19,6 +20,16 @@ else:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _normalize_name(package_name: str) -> str:
+    # Memoized worker for Package.normalize_name() below: the same package
+    # names are normalized over and over (once per lookup, once per installed
+    # distribution, etc.), and name cardinality is small enough that an
+    # unbounded cache stays tiny. Interning the result lets the dicts keyed
+    # on normalized names compare keys by pointer in the common case.
+    return sys.intern(package_name.lower().replace("-", "_"))
+
+
 class DependenciesMapping(str, Enum):
     """Types of dependency and imports mapping"""
 
@@ -44,8 +55,11 @@ class Package:
         # calculated from a union of self.mappings.values(). However, it is
         # still used often enough (.is_used() is called once per declared
         # dependency) that it makes sense to pre-calculate it, and rather hide
-        # the redundancy from our JSON output
-        self.import_names = {name for names in self.mappings.values() for name in names}
+        # the redundancy from our JSON output. Packages are commonly created
+        # without any mappings (and later populated via add_import_names()),
+        # in which case the default empty set is already correct.
+        if self.mappings:
+            self.import_names = set().union(*self.mappings.values())
         hide_dataclass_fields(self, "import_names")
 
     @staticmethod
@@ -58,7 +72,7 @@ class Package:
         context of the local environment with a slightly different spelling
         (e.g. typing_extension).
         """
-        return package_name.lower().replace("-", "_")
+        return _normalize_name(package_name)
 
     def add_import_names(
         self, *import_names: str, mapping: DependenciesMapping
@@ -87,37 +101,65 @@ class Package:
     @classmethod
     def identity_mapping(cls, package_name: str) -> "Package":
         """Factory for conveniently creating identity-mapped package object."""
-        ret = cls(package_name)
-        ret.add_identity_import()
-        return ret
+        # Passing the mapping directly to the constructor builds the Package
+        # in one shot, instead of creating an empty Package and then updating
+        # two members via add_identity_import()/add_import_names().
+        return cls(
+            package_name,
+            {DependenciesMapping.IDENTITY: {cls.normalize_name(package_name)}},
+        )
 
-    def is_used(self, imported_names: Iterable[str]) -> bool:
-        """Return True iff this package is among the given import names."""
-        return bool(self.import_names.intersection(imported_names))
+    def is_used(self, imported_names: AbstractSet[str]) -> bool:
+        """Return True iff this package is among the given import names.
+
+        This is called once per declared dependency, typically with the same
+        set of import names each time; callers should therefore build that
+        set _once_, rather than passing some iterable that must be rehashed
+        on every call.
+        """
+        # .isdisjoint() short-circuits on the first common element, and does
+        # not materialize the intersection like .intersection() would.
+        return not self.import_names.isdisjoint(imported_names)
 
 
 class LocalPackageLookup:
     """Lookup import names exposed by packages installed in the current venv."""
 
     def __init__(self) -> None:
+        self._packages: Optional[Dict[str, Package]] = None
+
+    @property
+    def packages(self) -> Dict[str, Package]:
         """Collect packages installed in the current python environment.
 
         Use importlib.metadata to look up the mapping between packages and their
         provided import names. This obviously depends on the Python environment
         (e.g. virtualenv) that we're calling from.
+
+        The environment enumeration is expensive (it reads metadata for every
+        installed package), so it is deferred until the first actual lookup;
+        a lookup object that is never consulted costs nothing.
         """
-        # We call packages_distributions() only _once here, and build a cache of
-        # Package objects from the information extracted.
-        self.packages: Dict[str, Package] = {}
-        for import_name, package_names in packages_distributions().items():
-            for package_name in package_names:
-                package = self.packages.setdefault(
-                    Package.normalize_name(package_name),
-                    Package(package_name),
-                )
-                package.add_import_names(
-                    import_name, mapping=DependenciesMapping.LOCAL_ENV
-                )
+        if self._packages is None:
+            # We call packages_distributions() only _once_ here, and build a
+            # cache of Package objects from the information extracted.
+            self._packages = {}
+            # Bind hot attribute lookups to locals outside the loop; this loop
+            # runs once per (import name, package name) pair in the environment.
+            normalize_name = Package.normalize_name
+            get_package = self._packages.get
+            for import_name, package_names in packages_distributions().items():
+                for package_name in package_names:
+                    normalized_name = normalize_name(package_name)
+                    package = get_package(normalized_name)
+                    if package is None:
+                        package = self._packages[normalized_name] = Package(
+                            package_name
+                        )
+                    package.add_import_names(
+                        import_name, mapping=DependenciesMapping.LOCAL_ENV
+                    )
+        return self._packages
 
     def lookup_package(self, package_name: str) -> Optional[Package]:
         """Convert a package name to a locally available Package object.
@@ -136,6 +178,31 @@ class LocalPackageLookup:
         """
         return self.packages.get(Package.normalize_name(package_name))
 
+    def lookup_packages(self, package_names: AbstractSet[str]) -> Dict[str, Package]:
+        """Convert a set of package names to locally available Package objects.
+
+        Bulk version of lookup_package() above: return a dict mapping those of
+        the given package names that are found in the current environment to
+        their corresponding Package objects. Names that cannot be found are
+        simply absent from the returned dict.
+        """
+        ret = {}
+        for name in package_names:
+            package = self.lookup_package(name)
+            if package is not None:
+                ret[name] = package
+        return ret
+
+
+@lru_cache(maxsize=8)
+def _local_package_lookup(_sys_path: Tuple[str, ...]) -> LocalPackageLookup:
+    # Cache LocalPackageLookup instances across resolve_dependencies() calls:
+    # enumerating the local environment reads metadata for _every_ installed
+    # package, which is far too expensive to repeat when sys.path (which fully
+    # determines the result) has not changed. The _sys_path argument is only
+    # used as the cache key; LocalPackageLookup itself reads sys.path.
+    return LocalPackageLookup()
+
 
 def resolve_dependencies(dep_names: Iterable[str]) -> Dict[str, Package]:
     """Associate dependencies with corresponding Package objects.
@@ -147,16 +214,19 @@ def resolve_dependencies(dep_names: Iterable[str]) -> Dict[str, Package]:
 
     Return a dict mapping dependency names to the resolved Package objects.
     """
+    deps = dict.fromkeys(dep_names)  # de-dup, preserving first-occurrence order
+    local_packages = _local_package_lookup(tuple(sys.path))
+    looked_up = local_packages.lookup_packages(deps.keys())
     ret = {}
-    local_packages = LocalPackageLookup()
-    for name in dep_names:
-        if name not in ret:
-            package = local_packages.lookup_package(name)
-            if package is None:  # fall back to identity mapping
-                package = Package.identity_mapping(name)
-                logger.info(
-                    f"Could not find {name!r} in the current environment. Assuming "
-                    f"it can be imported as {', '.join(sorted(package.import_names))}"
-                )
-            ret[name] = package
+    for name in deps:
+        package = looked_up.get(name)
+        if package is None:  # fall back to identity mapping
+            package = Package.identity_mapping(name)
+            logger.info(
+                "Could not find %r in the current environment. Assuming "
+                "it can be imported as %s",
+                name,
+                ", ".join(sorted(package.import_names)),
+            )
+        ret[name] = package
     return ret
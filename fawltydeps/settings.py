@@ -206,7 +206,7 @@ class Settings(BaseSettings):  # type: ignore
 
         # If user gives --verbose or --quiet on the command line, we _override_
         # any pre-configured verbosity value
-        if {"verbose", "quiet"}.intersection(args_dict.keys()):
+        if not {"verbose", "quiet"}.isdisjoint(args_dict):
             ret["verbosity"] = args_dict.get("verbose", 0) - args_dict.get("quiet", 0)
 
         return cls(**ret)
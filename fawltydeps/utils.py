@@ -5,25 +5,33 @@ from dataclasses import is_dataclass
 from pathlib import Path
 from typing import Iterator
 
+# Directories that never contain anything of interest to us, and that can be
+# arbitrarily big; prune them from the traversal. (Dot-dirs like .git/.tox are
+# already skipped by the startswith(".") test in walk_dir() below.)
+ALWAYS_SKIP_DIRS = frozenset(["__pycache__", "node_modules"])
+
 
 def walk_dir(path: Path) -> Iterator[Path]:
     """Walk a directory structure and yield Path objects for each file within.
 
     Wrapper around os.walk() that yields Path objects for files found (directly
     or transitively) under the given directory. Directories whose name start
-    with a dot are skipped.
+    with a dot, as well as those in ALWAYS_SKIP_DIRS, are skipped.
     """
     for root, dirs, files in os.walk(path):
-        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        dirs[:] = [
+            d for d in dirs if not d.startswith(".") and d not in ALWAYS_SKIP_DIRS
+        ]
         for filename in files:
             yield Path(root, filename)
 
 
 def dirs_between(parent: Path, child: Path) -> Iterator[Path]:
     """Yield directories between 'parent' and 'child', inclusive."""
-    yield child
-    if child != parent:
-        yield from dirs_between(parent, child.parent)
+    while child != parent:
+        yield child
+        child = child.parent
+    yield parent
 
 
 def hide_dataclass_fields(instance: object, *field_names: str) -> None:
@@ -17,7 +17,7 @@ from .utils import test_vectors
 def test_package__empty_package__matches_nothing():
     p = Package("foobar")  # no mappings
     assert p.package_name == "foobar"
-    assert not p.is_used(["foobar"])
+    assert not p.is_used({"foobar"})
 
 
 @pytest.mark.parametrize(
@@ -25,26 +25,30 @@ def test_package__empty_package__matches_nothing():
     [
         pytest.param(
             "foobar",
-            ["foobar", "and", "other", "names"],
-            ["only", "other", "names", "foo_bar", "Foobar", "FooBar", "FOOBAR"],
+            frozenset({"foobar", "and", "other", "names"}),
+            frozenset(
+                {"only", "other", "names", "foo_bar", "Foobar", "FooBar", "FOOBAR"}
+            ),
             id="simple_lowercase_name__matches_itself_only",
         ),
         pytest.param(
             "FooBar",
-            ["foobar", "and", "other", "names"],
-            ["only", "other", "names", "foo_bar", "Foobar", "FooBar", "FOOBAR"],
+            frozenset({"foobar", "and", "other", "names"}),
+            frozenset(
+                {"only", "other", "names", "foo_bar", "Foobar", "FooBar", "FOOBAR"}
+            ),
             id="mixed_case_name__matches_lowercase_only",
         ),
         pytest.param(
             "typing-extensions",
-            ["typing_extensions", "and", "other", "names"],
-            ["typing-extensions", "typingextensions"],
+            frozenset({"typing_extensions", "and", "other", "names"}),
+            frozenset({"typing-extensions", "typingextensions"}),
             id="name_with_hyphen__matches_name_with_underscore_only",
         ),
         pytest.param(
             "Foo-Bar",
-            ["foo_bar", "and", "other", "names"],
-            ["foo-bar", "Foobar", "FooBar", "FOOBAR"],
+            frozenset({"foo_bar", "and", "other", "names"}),
+            frozenset({"foo-bar", "Foobar", "FooBar", "FOOBAR"}),
             id="weird_name__matches_normalized_name_only",
         ),
     ],
@@ -64,50 +68,54 @@ def test_package__identity_mapping(
         pytest.param(
             "foobar",
             ["foobar"],
-            ["foobar", "and", "other", "names"],
-            ["only", "other", "names", "foo_bar", "Foobar", "FooBar", "FOOBAR"],
+            frozenset({"foobar", "and", "other", "names"}),
+            frozenset(
+                {"only", "other", "names", "foo_bar", "Foobar", "FooBar", "FOOBAR"}
+            ),
             id="simple_name_mapped_to_itself__matches_itself_only",
         ),
         pytest.param(
             "FooBar",
             ["FooBar"],
-            ["FooBar", "and", "other", "names"],
-            ["only", "other", "names", "foo_bar", "foobar", "FOOBAR"],
+            frozenset({"FooBar", "and", "other", "names"}),
+            frozenset({"only", "other", "names", "foo_bar", "foobar", "FOOBAR"}),
             id="mixed_case_name_mapped_to_itself__matches_exact_spelling_only",
         ),
         pytest.param(
             "typing-extensions",
             ["typing_extensions"],
-            ["typing_extensions", "and", "other", "names"],
-            ["typing-extensions", "typingextensions"],
+            frozenset({"typing_extensions", "and", "other", "names"}),
+            frozenset({"typing-extensions", "typingextensions"}),
             id="hyphen_name_mapped_to_underscore_name__matches_only_underscore_name",
         ),
         pytest.param(
             "Foo-Bar",
             ["blorp"],
-            ["blorp", "and", "other", "names"],
-            ["Foo-Bar", "foo-bar", "foobar", "FooBar", "FOOBAR", "Blorp", "BLORP"],
+            frozenset({"blorp", "and", "other", "names"}),
+            frozenset(
+                {"Foo-Bar", "foo-bar", "foobar", "FooBar", "FOOBAR", "Blorp", "BLORP"}
+            ),
             id="weird_name_mapped_diff_name__matches_diff_name_only",
         ),
         pytest.param(
             "foobar",
             ["foo", "bar", "baz"],
-            ["foo", "and", "other", "names"],
-            ["foobar", "and", "other", "names"],
+            frozenset({"foo", "and", "other", "names"}),
+            frozenset({"foobar", "and", "other", "names"}),
             id="name_with_three_imports__matches_first_import",
         ),
         pytest.param(
             "foobar",
             ["foo", "bar", "baz"],
-            ["bar", "and", "other", "names"],
-            ["foobar", "and", "other", "names"],
+            frozenset({"bar", "and", "other", "names"}),
+            frozenset({"foobar", "and", "other", "names"}),
             id="name_with_three_imports__matches_second_import",
         ),
         pytest.param(
             "foobar",
             ["foo", "bar", "baz"],
-            ["baz", "and", "other", "names"],
-            ["foobar", "and", "other", "names"],
+            frozenset({"baz", "and", "other", "names"}),
+            frozenset({"foobar", "and", "other", "names"}),
             id="name_with_three_imports__matches_third_import",
         ),
     ],
@@ -127,12 +135,12 @@ def test_package__both_mappings():
     import_names = ["foo", "bar", "baz"]
     p.add_import_names(*import_names, mapping=DependenciesMapping.LOCAL_ENV)
     assert p.package_name == "FooBar"  # package name is not normalized
-    assert p.is_used(["foobar"])  # but identity-mapped import name _is_.
-    assert p.is_used(["foo"])
-    assert p.is_used(["bar"])
-    assert p.is_used(["baz"])
-    assert not p.is_used(["fooba"])
-    assert not p.is_used(["foobarbaz"])
+    assert p.is_used({"foobar"})  # but identity-mapped import name _is_.
+    assert p.is_used({"foo"})
+    assert p.is_used({"bar"})
+    assert p.is_used({"baz"})
+    assert not p.is_used({"fooba"})
+    assert not p.is_used({"foobarbaz"})
     assert p.mappings == {
         DependenciesMapping.IDENTITY: {"foobar"},
         DependenciesMapping.LOCAL_ENV: {"foo", "bar", "baz"},